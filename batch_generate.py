@@ -0,0 +1,123 @@
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+
+from generate_texts import generate_texts, config_file_name, loc_file_ru
+from markdown_table import data_to_markdown_table, Alignment
+
+
+class VersionStats:
+    def __init__(self, name: str, seconds: float, entities: int, input_bytes: int, error: str = None):
+        self.name = name
+        self.seconds = seconds
+        self.entities = entities
+        self.input_bytes = input_bytes
+        self.error = error
+
+
+def find_versions(versions_path: str) -> list[str]:
+    # every sub folder with a config.xml is an archived game version
+    return sorted(name for name in os.listdir(versions_path)
+                  if os.path.exists(os.path.join(versions_path, name, config_file_name)))
+
+
+def process_version(versions_path: str, name: str, output_path: str) -> VersionStats:
+    config_path = os.path.join(versions_path, name)
+    input_bytes = sum(os.path.getsize(os.path.join(config_path, file_name))
+                      for file_name in (config_file_name, loc_file_ru))
+
+    start = time.perf_counter()
+    config = generate_texts(config_path, os.path.join(output_path, name))
+    seconds = time.perf_counter() - start
+
+    # mob cards are never written, same filter as in write_cards_to_files
+    hero_cards = [c for c in config.cards if not c.is_mob]
+    entities = len(config.visible_relics) + len(config.visible_consumables) + len(hero_cards)
+    return VersionStats(name, seconds, entities, input_bytes)
+
+
+def _stats_or_failure(name: str, get_stats: Callable[[], VersionStats]) -> VersionStats:
+    # a broken archive should not discard the versions that were processed fine
+    try:
+        return get_stats()
+    except Exception as e:
+        return VersionStats(name, 0.0, 0, 0, f"{type(e).__name__}: {e}")
+
+
+def stats_to_summary(all_stats: list[VersionStats], wall_seconds: float) -> list[str]:
+    stats = [s for s in all_stats if s.error is None]
+    failed = [s for s in all_stats if s.error is not None]
+
+    rows: list[list[str]] = [["Version", "Entities", "Input, KB", "Time, s", "Entities/s"]]
+    for s in stats:
+        rows.append([s.name, str(s.entities), f"{s.input_bytes / 1024:.1f}", f"{s.seconds:.3f}",
+                     f"{s.entities / s.seconds:.0f}" if s.seconds else ''])
+
+    total_entities = sum(s.entities for s in stats)
+    total_bytes = sum(s.input_bytes for s in stats)
+    alignment = [Alignment.LEFT] + [Alignment.RIGHT] * 4
+
+    summary: list[str] = ["# Batch summary"]
+    summary += data_to_markdown_table(rows, alignment)
+    summary.append("")
+    summary.append(f"Versions: {len(stats)}, entities: {total_entities}, wall time: {wall_seconds:.3f} s")
+    if wall_seconds:
+        summary.append(f"Throughput: {len(stats) / wall_seconds:.2f} versions/s, "
+                       f"{total_entities / wall_seconds:.0f} entities/s, "
+                       f"{total_bytes / wall_seconds / 1024 / 1024:.2f} MB/s")
+
+    if failed:
+        summary.append("")
+        summary.append(f"## Failed versions: {len(failed)}")
+        for s in failed:
+            summary.append(f"- {s.name}: {s.error}")
+    return summary
+
+
+def batch_generate(versions_path: str, output_path: str = "output", jobs: int = None) -> list[VersionStats]:
+    versions = find_versions(versions_path)
+    if not versions:
+        print(f"No {config_file_name} found in sub folders of {versions_path}")
+        return []
+
+    if not os.path.exists(output_path):
+        os.makedirs(output_path)
+
+    start = time.perf_counter()
+    if jobs == 1:
+        stats = [_stats_or_failure(name, lambda: process_version(versions_path, name, output_path))
+                 for name in versions]
+    else:
+        # strings are interned inside each version only, versions do not share memory
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(process_version, versions_path, name, output_path) for name in versions]
+            stats = [_stats_or_failure(name, future.result) for name, future in zip(versions, futures)]
+    wall_seconds = time.perf_counter() - start
+
+    summary = stats_to_summary(stats, wall_seconds)
+    with open(os.path.join(output_path, "summary.md"), "w", encoding="utf-8") as f:
+        f.write("\n".join(summary))
+    print("\n".join(summary))
+
+    return stats
+
+
+if __name__ == '__main__':
+    usage = "Usage: batch_generate.py <versions path> [output path] [jobs]"
+    if len(sys.argv) < 2 or not os.path.isdir(sys.argv[1]):
+        print(usage)
+        exit(1)
+
+    batch_jobs = None
+    if len(sys.argv) > 3:
+        if not sys.argv[3].isdigit() or int(sys.argv[3]) < 1:
+            print(usage)
+            print("jobs must be a positive number")
+            exit(1)
+        batch_jobs = int(sys.argv[3])
+
+    batch_stats = batch_generate(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else "output", batch_jobs)
+    if any(s.error is not None for s in batch_stats):
+        exit(1)
@@ -0,0 +1,265 @@
+import json
+import os
+import sys
+import xml.etree.ElementTree as ElementTree
+from array import array
+from typing import Iterable, Iterator, Any
+
+from locale import Locale
+from data_model import PlayableItem, Config, Card
+from generate_texts import loc_ru, config_file_name, loc_file_ru, load_locale, add_hero_names, process_card_descr
+
+# field name -> column type, order is the record order
+record_fields: dict[str, str] = {
+    "key": "str",
+    "type": "str",
+    "name": "str",
+    "descr": "str",
+    "quality": "int",
+    "quality_label": "str",
+    "source": "str",
+    "source_label": "str",
+    "hero": "str",
+    "hero_name": "str",
+    "cost": "int",
+    "card_type": "str",
+    "damage": "int",
+    "armor": "int",
+}
+
+# int columns are little endian int32, missing values are stored as int32 min
+_int_dtype = "<i4"
+_int_null = -2 ** 31
+_int_max = 2 ** 31 - 1
+assert array("i").itemsize == 4, "int columns require 4 byte C int"
+
+# records are buffered before being appended to the column files
+_column_chunk_size = 1024
+
+
+def item_to_record(item: PlayableItem, loc: Locale) -> dict[str, Any]:
+    is_card = isinstance(item, Card)
+    source_name = item.get_item_source_name() if item.source is not None else None
+
+    return {
+        "key": item.key,
+        "type": item.get_item_type_str(),
+        "name": loc[item.name],
+        "descr": process_card_descr(item, loc) if is_card else loc.process(item.descr),
+        "quality": item.quality,
+        "quality_label": loc.get(item.quality_str) if item.quality >= 0 else '',
+        "source": source_name,
+        "source_label": loc[item.get_item_source_loc()],
+        "hero": item.related_hero,
+        "hero_name": loc[item.related_hero],
+        "cost": item.cost if is_card else None,
+        "card_type": loc.process(item.get_card_type_name()) if is_card else None,
+        "damage": item.damage if is_card else None,
+        "armor": item.armor if is_card else None,
+    }
+
+
+def iter_records(config: Config, loc: Locale) -> Iterator[dict[str, Any]]:
+    for relic in config.visible_relics:
+        yield item_to_record(relic, loc)
+    for consumable in config.visible_consumables:
+        yield item_to_record(consumable, loc)
+    for card in config.cards:
+        if not card.is_mob:
+            yield item_to_record(card, loc)
+
+
+def validate_record(record: dict[str, Any]):
+    # checked before any sink is written, so a bad record never leaves sinks out of step
+    if record.keys() != record_fields.keys():
+        raise ValueError(f"Record {record.get('key')} fields do not match export fields")
+
+    for field, field_type in record_fields.items():
+        value = record[field]
+        if value is None:
+            continue
+        if field_type == "int":
+            if not isinstance(value, int) or not _int_null < value <= _int_max:
+                raise ValueError(f"Value {value} of {field} in {record['key']} does not fit into {_int_dtype} column")
+        elif not isinstance(value, str):
+            raise ValueError(f"Value {value} of {field} in {record['key']} is not a string")
+
+
+class NdjsonSink:
+    def __init__(self, file_name: str):
+        self.path = file_name
+        self.file = open(file_name, "w", encoding="utf-8", newline="\n")
+
+    def write(self, record: dict[str, Any]):
+        self.file.write(json.dumps(record, ensure_ascii=False))
+        self.file.write("\n")
+
+    def close(self):
+        self.file.close()
+
+    def abort(self):
+        self.file.close()
+        os.remove(self.path)
+
+
+class _IntColumn:
+    def __init__(self, file_name: str):
+        self.file = open(file_name, "wb")
+        self.values = array("i")
+
+    def append(self, value: int | None):
+        self.values.append(_int_null if value is None else value)
+
+    def flush(self):
+        if sys.byteorder != "little":
+            self.values.byteswap()
+        self.values.tofile(self.file)
+        self.values = array("i")
+
+    def close(self):
+        self.flush()
+        self.file.close()
+
+    def abort(self):
+        self.file.close()
+        os.remove(self.file.name)
+
+
+# utf-8 data file plus int64 offsets file with count + 1 entries and uint8 validity file, as in Arrow string columns
+class _StrColumn:
+    def __init__(self, file_name: str):
+        self.file = open(file_name + ".utf8", "wb")
+        self.offsets_file = open(file_name + ".offsets", "wb")
+        self.valid_file = open(file_name + ".valid", "wb")
+        self.offset = 0
+        self.offsets = array("q", [0])
+        self.valid = bytearray()
+        self.data = bytearray()
+
+    def append(self, value: str | None):
+        if value is not None:
+            self.data += value.encode("utf-8")
+        self.offsets.append(self.offset + len(self.data))
+        self.valid.append(value is not None)
+
+    def flush(self):
+        self.file.write(self.data)
+        self.offset += len(self.data)
+        self.data.clear()
+
+        if sys.byteorder != "little":
+            self.offsets.byteswap()
+        self.offsets.tofile(self.offsets_file)
+        self.offsets = array("q")
+
+        self.valid_file.write(self.valid)
+        self.valid.clear()
+
+    def close(self):
+        self.flush()
+        self.file.close()
+        self.offsets_file.close()
+        self.valid_file.close()
+
+    def abort(self):
+        for f in (self.file, self.offsets_file, self.valid_file):
+            f.close()
+            os.remove(f.name)
+
+
+class ColumnsSink:
+    def __init__(self, folder: str):
+        self.path = folder
+        self.count = 0
+        os.makedirs(folder, exist_ok=True)
+
+        # schema.json is written last and marks a complete export, drop the one from a previous run
+        self.schema_file_name = os.path.join(folder, "schema.json")
+        if os.path.exists(self.schema_file_name):
+            os.remove(self.schema_file_name)
+
+        self.columns: dict[str, _IntColumn | _StrColumn] = {}
+        self.schema: dict[str, dict[str, Any]] = {}
+        for field, field_type in record_fields.items():
+            file_name = os.path.join(folder, field)
+            if field_type == "int":
+                self.columns[field] = _IntColumn(file_name + ".i32")
+                self.schema[field] = {"files": [f"{field}.i32"], "dtype": _int_dtype, "null": _int_null}
+            else:
+                self.columns[field] = _StrColumn(file_name)
+                self.schema[field] = {"files": [f"{field}.utf8", f"{field}.offsets", f"{field}.valid"],
+                                      "dtype": "utf8", "offsets": "<i8", "valid": "u1"}
+
+    def write(self, record: dict[str, Any]):
+        for field, column in self.columns.items():
+            column.append(record[field])
+        self.count += 1
+        if self.count % _column_chunk_size == 0:
+            for column in self.columns.values():
+                column.flush()
+
+    def close(self):
+        for column in self.columns.values():
+            column.close()
+
+        with open(self.schema_file_name, "w", encoding="utf-8") as f:
+            json.dump({"count": self.count, "fields": self.schema}, f, indent=2)
+
+    def abort(self):
+        for column in self.columns.values():
+            column.abort()
+
+
+def write_records(records: Iterable[dict[str, Any]], sinks: list[NdjsonSink | ColumnsSink]) -> int:
+    # records are produced once and passed to every sink as they come
+    count = 0
+    try:
+        for record in records:
+            validate_record(record)
+            for sink in sinks:
+                sink.write(record)
+            count += 1
+    except BaseException:
+        # partial output is removed, a failed export must not look complete
+        for sink in sinks:
+            sink.abort()
+        raise
+
+    for sink in sinks:
+        sink.close()
+    return count
+
+
+def write_ndjson(records: Iterable[dict[str, Any]], file_name: str) -> int:
+    return write_records(records, [NdjsonSink(file_name)])
+
+
+def write_columns(records: Iterable[dict[str, Any]], folder: str) -> int:
+    return write_records(records, [ColumnsSink(folder)])
+
+
+def export_data(config_path: str, ndjson_file_name: str, columns_folder: str = None):
+    config_xml = ElementTree.parse(os.path.join(config_path, config_file_name))
+    config = Config(config_xml.getroot())
+
+    loc = load_locale(loc_ru, os.path.join(config_path, loc_file_ru))
+    add_hero_names(config, loc)
+
+    sinks: list[NdjsonSink | ColumnsSink] = [NdjsonSink(ndjson_file_name)]
+    if columns_folder:
+        sinks.append(ColumnsSink(columns_folder))
+
+    count = write_records(iter_records(config, loc), sinks)
+    for sink in sinks:
+        print(f"Exported {count} records to {sink.path}")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2 or not os.path.exists(os.path.join(sys.argv[1], config_file_name)):
+        print("Usage: data_export.py <config path> [columns folder]")
+        exit(1)
+
+    if not os.path.exists("output"):
+        os.mkdir("output")
+
+    export_data(sys.argv[1], os.path.join("output", "data.ndjson"), sys.argv[2] if len(sys.argv) > 2 else None)
@@ -1,3 +1,4 @@
+import sys
 import xml.etree.ElementTree as ElementTree
 from enum import Enum
 from typing import TypeVar
@@ -9,9 +10,16 @@ _hero_key_suffix = "_HERO_"
 _hidden_key_suffix = "_HIDDEN_"
 _test_item_suffix = "_TEST"
 
+def safe_intern(value: str | None) -> str | None:
+    return sys.intern(value) if value is not None else None
+
+
 def safe_get_text(element: ElementTree.Element, path: str, default: str = None) -> str | None:
     elem_node = element.find(path)
-    return elem_node.text if elem_node is not None else default
+    if elem_node is None:
+        return default
+    # keys and names repeat across items and locale keys of one config, intern to keep a single copy
+    return safe_intern(elem_node.text)
 
 
 def safe_get_int(element: ElementTree.Element, path: str, default: int = None) -> int | None:
@@ -32,7 +40,7 @@ class BaseItem:
     def __init__(self, element: ElementTree.Element):
         self.name = safe_get_text(element, ".//visual//name")
         self.descr = safe_get_text(element, ".//visual//desc")
-        self.key = element.attrib.get("key")
+        self.key = safe_intern(element.attrib.get("key"))
 
 
 class ItemQuality(Enum):
@@ -130,10 +138,6 @@ class Unit(BaseItem):
         self.is_hero = element.find(".//type//hero") is not None
 
 
-def default_item_sorting_fn(x: PlayableItem):
-    return -x.quality, x.key
-
-
 TPI = TypeVar("TPI", bound=PlayableItem)
 
 
@@ -173,11 +177,9 @@ class Config:
             incorrect_names = map(lambda x: x.key, sorted(incorrect_non_hidden, key=lambda x: x.key))
             print(', '.join(incorrect_names))
 
-        only_non_test_items = (
-            filter(lambda x: True if x.related_hero is None else x.related_hero in only_real_hero_names,
-                   only_non_hidden_items))
-
-        return sorted(only_non_test_items, key=default_item_sorting_fn)
+        # keep config order, outputs are sorted by localized names when rendered
+        return list(filter(lambda x: True if x.related_hero is None else x.related_hero in only_real_hero_names,
+                           only_non_hidden_items))
 
     def _process_items(self):
         # filter out any test and dummy heroes
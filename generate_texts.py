@@ -34,17 +34,18 @@ loc_ru: dict[str, str] = {
 }
 
 
+def item_sort_key(item: PlayableItem, loc: Locale):
+    # key breaks ties between items with identical localized names
+    return -item.quality, loc.sort_key(item.name), loc.sort_key(item.related_hero), item.key
+
+
 def items_to_markdown_table(items: list[PlayableItem],
                             get_item_header: Callable[[], Sequence[str]],
                             item_to_row: Callable[[PlayableItem], Sequence[str]],
                             item_type_str: str, loc: Locale) -> list[str]:
+    # items are expected to be already sorted with item_sort_key
     result: list[str] = []
 
-    def item_sort_key(x: PlayableItem):
-        return -x.quality, loc[x.name], loc[x.related_hero]
-
-    items.sort(key=item_sort_key, reverse=False)
-
     rows: list[list[str]] = []
     for k, group in itertools.groupby(items, lambda x: -x.quality):
         item_type_loc = loc[f"{item_type_str}_{-k}"]
@@ -55,7 +56,7 @@ def items_to_markdown_table(items: list[PlayableItem],
         for v in group:
             rows.append(list(item_to_row(v)))
 
-        table = data_to_markdown_table(rows, remove_empty_columns=True)
+        table = data_to_markdown_table(rows, remove_empty_cols=True)
         result += table
         rows.clear()
         result.append("")
@@ -120,10 +121,7 @@ def process_wiki(sorted_items: list[PlayableItem], loc: Locale) -> list[str]:
 
 
 def process_items(items: list[PlayableItem], type_header: str, loc: Locale) -> tuple[list[str], list[str]]:
-    def item_sort_key(x: PlayableItem):
-        return -x.quality, loc[x.name], loc[x.related_hero]
-
-    sorted_items = sorted(items, key=item_sort_key, reverse=False)
+    sorted_items = sorted(items, key=lambda x: item_sort_key(x, loc))
 
     markdown = process_markdown(sorted_items, loc, type_header)
 
@@ -132,19 +130,20 @@ def process_items(items: list[PlayableItem], type_header: str, loc: Locale) -> t
     return markdown, wiki
 
 
-def write_items_to_files(items: list[PlayableItem], item_name: str, type_header: str, loc: Locale):
+def write_items_to_files(items: list[PlayableItem], item_name: str, type_header: str, loc: Locale,
+                         output_path: str = "output"):
     (markdown, wiki) = process_items(items, type_header, loc)
     
-    with open(os.path.join("output", f"{item_name}.md"), "w", encoding="utf-8") as f:
+    with open(os.path.join(output_path, f"{item_name}.md"), "w", encoding="utf-8") as f:
         f.write("\n".join(markdown))
 
-    with open(os.path.join("output", f"{item_name}_wiki.txt"), "w", encoding="utf-8") as f:
+    with open(os.path.join(output_path, f"{item_name}_wiki.txt"), "w", encoding="utf-8") as f:
         f.write("\n".join(wiki))
 
 
-def write_cards_to_files(cards: list[Card], loc: Locale):
+def write_cards_to_files(cards: list[Card], loc: Locale, output_path: str = "output"):
     def card_sort_key(x: Card):
-        return x.related_hero if x.related_hero else '', -x.quality, loc[x.name]
+        return x.related_hero if x.related_hero else '', -x.quality, loc.sort_key(x.name)
 
     hero_cards = filter(lambda x: not x.is_mob, cards)
     sorted_cards = sorted(hero_cards, key=card_sort_key)
@@ -164,10 +163,21 @@ def write_cards_to_files(cards: list[Card], loc: Locale):
         # with open(os.path.join("output", f"cards_{hero}.md"), "w", encoding="utf-8") as f:
         #     f.write("\n".join(cards_md))
 
-        with open(os.path.join("output", f"cards_{hero_name}_wiki.txt"), "w", encoding="utf-8") as f:
+        with open(os.path.join(output_path, f"cards_{hero_name}_wiki.txt"), "w", encoding="utf-8") as f:
             f.write("\n".join(cards_wiki))
 
 
+def process_card_descr(card: Card, loc: Locale) -> str:
+    descr = loc.process(card.descr)
+    if card.damage:
+        s = str(card.damage)
+        descr = descr.replace('[DAMAGE]', f'[DAMAGE:{s}]')
+    if card.armor:
+        s = str(card.armor)
+        descr = descr.replace('[ARMOR]', f'[ARMOR:{s}]')
+    return descr
+
+
 def process_cards_to_wiki(cards: list[Card], loc: Locale) -> list[str]:
     def wiki_get_card_header():
         return [loc['_name_'],
@@ -177,20 +187,10 @@ def process_cards_to_wiki(cards: list[Card], loc: Locale) -> list[str]:
                 loc['_type_'],
                 loc['_src_']]
     
-    def process_descr(card):
-        descr = loc.process(card.descr)
-        if card.damage:
-            s = str(card.damage)
-            descr = descr.replace('[DAMAGE]', f'[DAMAGE:{s}]')
-        if card.armor:
-            s = str(card.armor)
-            descr = descr.replace('[ARMOR]', f'[ARMOR:{s}]')
-        return descr
-
     def wiki_card_to_row(card: Card):
         return [loc[card.name], 
                 card.cost,
-                process_descr(card), 
+                process_card_descr(card, loc), 
                 str(card.quality) if card.quality >=0 else '',
                 loc.process(card.get_card_type_name()),
                 loc[card.get_item_source_loc()]]
@@ -217,7 +217,13 @@ def load_locale(base_strings: Dict[str, str], loc_file_name: str):
     return loc
 
 
-def generate_texts(config_path):
+def add_hero_names(config: Config, loc: Locale):
+    # prepare hero unit names for relic relations
+    for unit in filter(lambda x: x in config.only_real_heroes, config.units):
+        loc[unit.key] = loc[unit.name]
+
+
+def generate_texts(config_path, output_path: str = "output") -> Config:
     if config_path is None:
         print("Could not find game installation folder.")
         exit(1)
@@ -233,19 +239,18 @@ def generate_texts(config_path):
     loc = load_locale(loc_ru, os.path.join(config_path, loc_file_ru))
 
     print("Processing relics and consumables...")
-    # prepare hero unit names for relic relations
-    for unit in filter(lambda x: x in config.only_real_heroes, config.units):
-        loc[unit.key] = loc[unit.name]
+    add_hero_names(config, loc)
 
-    write_items_to_files(config.visible_relics, "relics", "Relics", loc)    
-    write_items_to_files(config.visible_consumables, "consumables", "Consumables", loc)
-    
-    write_cards_to_files(config.cards, loc)
+    if not os.path.exists(output_path):
+        os.makedirs(output_path)
 
-    if not os.path.exists("output"):
-        os.mkdir("output")
+    write_items_to_files(config.visible_relics, "relics", "Relics", loc, output_path)
+    write_items_to_files(config.visible_consumables, "consumables", "Consumables", loc, output_path)
+    
+    write_cards_to_files(config.cards, loc, output_path)
 
     print("Done!")
+    return config
 
 
 if __name__ == '__main__':
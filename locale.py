@@ -1,4 +1,5 @@
 import re
+import sys
 from typing import Dict
 from xml.etree import ElementTree
 
@@ -6,13 +7,24 @@ from xml.etree import ElementTree
 # [TERM_ETHER:Spectral]. [TERM_UNPLAYABLE:Unplayable]. Lose 1 [ICON_ENERGY] when this card appears in your hand. 
 _inline_re = re.compile(r"\[(\w+?):(.+?)]")
 
+# Russian collation treats ё as е on the primary level, code points put it after я
+_primary_collation_table = str.maketrans({'ё': 'е'})
+
+
+def collation_key(value: str) -> tuple[str, str, str]:
+    folded = value.casefold()
+    return folded.translate(_primary_collation_table), folded, value
+
+
 class Locale:
     def __init__(self):
         self.strings: Dict[str, str] = {}
         self.replace_rules: list[tuple[str, str]] = []
+        self._sort_keys: Dict[str, tuple[str, str, str]] = {}
         
     def __setitem__(self, key, value):
         self.strings[key] = value
+        self._sort_keys.pop(key, None)
 
     def __getitem__(self, key):
         if key is None:
@@ -44,16 +56,31 @@ class Locale:
         # replace [k:v] with <v>
         value = _inline_re.sub(lambda m: f"<{m.group(2)}>", value)
         return value
+
+    def sort_key(self, key: str) -> tuple[str, str, str]:
+        # collation keys are cached per locale, every sorted view reuses them
+        if key is None:
+            key = ''
+
+        sort_key = self._sort_keys.get(key)
+        if sort_key is None:
+            sort_key = collation_key(self[key] or '')
+            self._sort_keys[key] = sort_key
+        return sort_key
     
     def append_locale(self, other: 'Locale'):
         self.strings.update(other.strings)
+        self._sort_keys.clear()
         
     def append_dict(self, other: Dict[str, str]):
         self.strings.update(other)
+        self._sort_keys.clear()
         
     def append_xml(self, root: ElementTree):
         for child in root.getroot():
-            self.strings[child.attrib["key"]] = child.text
+            text = child.text
+            self.strings[sys.intern(child.attrib["key"])] = sys.intern(text) if text is not None else None
+        self._sort_keys.clear()
             
     def add_replace_rule(self, old:str, new: str):
         self.replace_rules.append((old, new))
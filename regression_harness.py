@@ -0,0 +1,346 @@
+import contextlib
+import io
+import math
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ElementTree
+from typing import Callable, Any
+
+from data_model import Config
+from generate_texts import (generate_texts, loc_ru, config_file_name, loc_file_ru, load_locale, add_hero_names,
+                            item_sort_key, process_markdown, process_wiki, write_cards_to_files, process_card_descr)
+from markdown_table import calculate_column_widths, data_to_markdown_table
+from table_utils import preprocess_table, data_to_wiki_table
+
+_regression_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "regression")
+_fixture_path = os.path.join(_regression_path, "fixture")
+_golden_path = os.path.join(_regression_path, "golden")
+
+# synthetic config sizes: relics, consumables, cards, heroes
+_golden_synthetic_size = (40, 20, 80, 3)
+_budget_synthetic_size = (2000, 1000, 4000, 8)
+
+# stage -> (seconds, peak allocated MB) on the budget synthetic config, generous to survive slow machines
+stage_budgets: dict[str, tuple[float, float]] = {
+    "parse config": (2.0, 48.0),
+    "load locale": (1.0, 32.0),
+    "sort items": (0.5, 8.0),
+    "locale process": (0.5, 8.0),
+    "markdown tables": (1.0, 32.0),
+    "wiki tables": (1.0, 32.0),
+    "cards": (2.0, 32.0),
+}
+
+# time(n * factor) / time(n) should grow close to factor, larger exponents mean super-linear behaviour
+_scaling_rows = 5000
+_scaling_factor = 4
+_scaling_max_exponent = 1.5
+
+_syllables = ["ба", "ве", "гу", "дё", "жи", "зо", "ка", "лё", "ми", "но", "пу", "ры", "сё", "ту", "хо", "че", "ёж"]
+_descr_templates = [
+    "Дает {n} [ICON_ENERGY].",
+    "[TERM_ETHER:Призрачный]. Наносит [DAMAGE] урона.",
+    "Дает [ARMOR] брони.",
+    "Лечит {n}\xa0здоровья.",
+    "[TERM_UNPLAYABLE:Неиграбельная]. Теряет {n} [ICON_ENERGY].",
+]
+
+
+class StageResult:
+    def __init__(self, name: str, seconds: float, peak_bytes: int):
+        self.name = name
+        self.seconds = seconds
+        self.peak_bytes = peak_bytes
+
+
+def _random_word(rng: random.Random) -> str:
+    word = "".join(rng.choice(_syllables) for _ in range(rng.randint(2, 4)))
+    return word.capitalize() if rng.random() < 0.8 else word
+
+
+def write_synthetic_config(path: str, relics: int, consumables: int, cards: int, heroes: int, seed: int = 0):
+    rng = random.Random(seed)
+    config = ElementTree.Element("config")
+    strings = ElementTree.Element("strings")
+
+    def add_string(key: str, text: str):
+        ElementTree.SubElement(strings, "s", key=key).text = text
+
+    def add_text(parent: ElementTree.Element, tag: str, text: Any) -> ElementTree.Element:
+        elem = ElementTree.SubElement(parent, tag)
+        elem.text = str(text)
+        return elem
+
+    def add_visual(parent: ElementTree.Element, key: str):
+        visual = ElementTree.SubElement(parent, "visual")
+        add_text(visual, "name", f"{key}_NAME")
+        add_text(visual, "desc", f"{key}_DESC")
+        add_string(f"{key}_NAME", _random_word(rng))
+        add_string(f"{key}_DESC", rng.choice(_descr_templates).format(n=rng.randint(1, 9)))
+        return visual
+
+    hero_keys = [f"HERO_SYNTH_{idx}" for idx in range(heroes)]
+    for hero_key in hero_keys:
+        unit = ElementTree.SubElement(config, "unit", key=hero_key)
+        add_visual(unit, f"UNIT_{hero_key}")
+        add_text(unit, "hp", rng.randint(50, 90))
+        ElementTree.SubElement(ElementTree.SubElement(unit, "type"), "hero")
+
+    def add_playable(tag: str, key: str, quality: int) -> ElementTree.Element:
+        elem = ElementTree.SubElement(config, tag, key=key)
+        add_visual(elem, key)
+        add_text(elem, "quality", quality)
+        add_text(elem, "source", rng.randint(0, 3))
+        if rng.random() < 0.2:
+            ElementTree.SubElement(elem, "flags")
+        if rng.random() < 0.3:
+            add_text(elem, "related_hero", rng.choice(hero_keys))
+        return elem
+
+    for idx in range(relics):
+        add_playable("relic", f"RELIC_SYNTH_{idx}", rng.randint(0, 5))
+    for idx in range(consumables):
+        add_playable("consumable", f"CONSUMABLE_SYNTH_{idx}", rng.randint(0, 2))
+    for idx in range(cards):
+        card = add_playable("card", f"CARD_HERO_SYNTH_{idx}", rng.randint(0, 3))
+        add_text(card, "cost", rng.randint(0, 3))
+        add_text(card, "type", rng.randint(1, 5))
+        effects = ElementTree.SubElement(card, "effects")
+        if rng.random() < 0.5:
+            ElementTree.SubElement(effects, "damage", value=str(rng.randint(1, 20)))
+        if rng.random() < 0.3:
+            ElementTree.SubElement(effects, "add_armor", value=str(rng.randint(1, 20)))
+
+    for quality in range(6):
+        for type_str in ("RELIC_TYPE", "CONSUMABLE_TYPE"):
+            add_string(f"{type_str}_{quality}", _random_word(rng))
+    for card_type in ("ATTACK", "SKILL", "POWER", "STATUS", "CURSE"):
+        add_string(f"CARD_TYPE_{card_type}", _random_word(rng))
+
+    os.makedirs(path, exist_ok=True)
+    ElementTree.ElementTree(config).write(os.path.join(path, config_file_name), encoding="utf-8")
+    ElementTree.ElementTree(strings).write(os.path.join(path, loc_file_ru), encoding="utf-8")
+
+
+def run_generate_texts(config_path: str, output_path: str):
+    with contextlib.redirect_stdout(io.StringIO()):
+        generate_texts(config_path, output_path)
+
+
+def compare_with_golden(output_path: str, golden_path: str) -> list[str]:
+    errors: list[str] = []
+    output_files = set(os.listdir(output_path))
+    golden_files = set(os.listdir(golden_path)) if os.path.exists(golden_path) else set()
+
+    for file_name in sorted(golden_files - output_files):
+        errors.append(f"{file_name}: missing in output")
+    for file_name in sorted(output_files - golden_files):
+        errors.append(f"{file_name}: no golden output")
+
+    for file_name in sorted(output_files & golden_files):
+        with open(os.path.join(output_path, file_name), "rb") as f:
+            output = f.read()
+        with open(os.path.join(golden_path, file_name), "rb") as f:
+            golden = f.read()
+        if output == golden:
+            continue
+
+        output_lines = output.decode("utf-8").split("\n")
+        golden_lines = golden.decode("utf-8").split("\n")
+        line = next((idx for idx, (a, b) in enumerate(zip(output_lines, golden_lines)) if a != b),
+                    min(len(output_lines), len(golden_lines)))
+        errors.append(f"{file_name}: differs from golden output at line {line + 1}")
+    return errors
+
+
+def golden_cases(work_path: str) -> dict[str, str]:
+    synthetic_path = os.path.join(work_path, "synthetic_config")
+    write_synthetic_config(synthetic_path, *_golden_synthetic_size)
+    return {"fixture": _fixture_path, "synthetic": synthetic_path}
+
+
+def check_golden(work_path: str) -> list[str]:
+    errors: list[str] = []
+    for name, config_path in golden_cases(work_path).items():
+        output_path = os.path.join(work_path, name)
+        run_generate_texts(config_path, output_path)
+        errors += [f"{name}/{error}" for error in compare_with_golden(output_path, os.path.join(_golden_path, name))]
+    return errors
+
+
+def update_golden(work_path: str):
+    for name, config_path in golden_cases(work_path).items():
+        output_path = os.path.join(work_path, name)
+        run_generate_texts(config_path, output_path)
+
+        golden_path = os.path.join(_golden_path, name)
+        if os.path.exists(golden_path):
+            shutil.rmtree(golden_path)
+        shutil.copytree(output_path, golden_path)
+        print(f"Updated {golden_path}")
+
+
+def _measure(name: str, results: list[StageResult], fn: Callable[[], Any],
+             reset: Callable[[], None] = None) -> Any:
+    # time and allocations are measured in separate runs, tracemalloc slows everything down,
+    # reset brings caches back to cold state so both runs do the full work
+    if reset:
+        reset()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+
+    if reset:
+        reset()
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    results.append(StageResult(name, seconds, peak_bytes))
+    return result
+
+
+def run_stages(config_path: str, output_path: str) -> list[StageResult]:
+    results: list[StageResult] = []
+    os.makedirs(output_path, exist_ok=True)
+
+    def parse_config():
+        return Config(ElementTree.parse(os.path.join(config_path, config_file_name)).getroot())
+
+    config = _measure("parse config", results, parse_config)
+
+    def load_config_locale():
+        loc = load_locale(loc_ru, os.path.join(config_path, loc_file_ru))
+        add_hero_names(config, loc)
+        return loc
+
+    loc = _measure("load locale", results, load_config_locale)
+
+    item_lists = [(config.visible_relics, "Relics"), (config.visible_consumables, "Consumables")]
+
+    def sort_items():
+        return [(sorted(items, key=lambda x: item_sort_key(x, loc)), header) for items, header in item_lists]
+
+    def clear_sort_keys():
+        loc._sort_keys.clear()
+
+    sorted_lists = _measure("sort items", results, sort_items, clear_sort_keys)
+
+    hero_cards = [c for c in config.cards if not c.is_mob]
+
+    def process_descriptions():
+        # cards go through the same description path as write_cards_to_files
+        return ([loc.process(item.descr) for item in config.visible_relics + config.visible_consumables] +
+                [process_card_descr(card, loc) for card in hero_cards])
+
+    _measure("locale process", results, process_descriptions)
+    _measure("markdown tables", results,
+             lambda: [process_markdown(items, loc, header) for items, header in sorted_lists if items])
+    _measure("wiki tables", results, lambda: [process_wiki(items, loc) for items, header in sorted_lists if items])
+    _measure("cards", results, lambda: write_cards_to_files(config.cards, loc, output_path), clear_sort_keys)
+    return results
+
+
+def check_budgets(results: list[StageResult]) -> list[str]:
+    errors: list[str] = []
+    for result in results:
+        max_seconds, max_mb = stage_budgets[result.name]
+        peak_mb = result.peak_bytes / 1024 / 1024
+        print(f"{result.name}: {result.seconds:.3f} s (budget {max_seconds} s), "
+              f"peak {peak_mb:.1f} MB (budget {max_mb} MB)")
+        if result.seconds > max_seconds:
+            errors.append(f"{result.name}: {result.seconds:.3f} s exceeds {max_seconds} s budget")
+        if peak_mb > max_mb:
+            errors.append(f"{result.name}: peak {peak_mb:.1f} MB exceeds {max_mb} MB budget")
+    return errors
+
+
+def _best_time(fn: Callable[[], Any], repeat: int = 3) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _synthetic_table(rows: int) -> list[list[str]]:
+    # last column stays empty so column pruning has to scan every row
+    rng = random.Random(rows)
+    table = [["Название", "Эффект", "Редкость", "Пусто"]]
+    for idx in range(rows):
+        table.append([_random_word(rng), rng.choice(_descr_templates), str(idx % 6), ""])
+    return table
+
+
+def scaling_cases(work_path: str) -> dict[str, Callable[[int], Callable[[], Any]]]:
+    def table_case(fn: Callable[[list[list[str]]], Any]) -> Callable[[int], Callable[[], Any]]:
+        def build(rows: int):
+            table = _synthetic_table(rows)
+            return lambda: fn(table)
+        return build
+
+    def pipeline_case(rows: int):
+        # full runs are far slower than single tables, keep them small
+        rows //= 10
+        config_path = os.path.join(work_path, f"scaling_config_{rows}")
+        write_synthetic_config(config_path, rows, rows // 2, rows, 4)
+        return lambda: run_generate_texts(config_path, os.path.join(work_path, f"scaling_output_{rows}"))
+
+    return {
+        "calculate_column_widths": table_case(calculate_column_widths),
+        "preprocess_table": table_case(lambda table: preprocess_table(table, remove_empty_columns=True)),
+        "data_to_markdown_table": table_case(lambda table: data_to_markdown_table(table, remove_empty_cols=True)),
+        "data_to_wiki_table": table_case(lambda table: data_to_wiki_table(table, remove_empty_columns=True)),
+        "generate_texts": pipeline_case,
+    }
+
+
+def check_scaling(work_path: str) -> list[str]:
+    errors: list[str] = []
+    for name, build in scaling_cases(work_path).items():
+        small = _best_time(build(_scaling_rows))
+        large = _best_time(build(_scaling_rows * _scaling_factor))
+        exponent = math.log(large / small, _scaling_factor) if small > 0 and large > 0 else 0.0
+        print(f"{name}: {small:.4f} s -> {large:.4f} s, exponent {exponent:.2f}")
+        if exponent > _scaling_max_exponent:
+            errors.append(f"{name}: super-linear scaling, exponent {exponent:.2f} > {_scaling_max_exponent}")
+    return errors
+
+
+def run_harness() -> list[str]:
+    with tempfile.TemporaryDirectory() as work_path:
+        print("Comparing outputs with golden outputs...")
+        errors = check_golden(work_path)
+
+        print("Checking stage budgets...")
+        budget_config_path = os.path.join(work_path, "budget_config")
+        write_synthetic_config(budget_config_path, *_budget_synthetic_size)
+        errors += check_budgets(run_stages(budget_config_path, os.path.join(work_path, "budget_output")))
+
+        print("Checking scaling...")
+        errors += check_scaling(work_path)
+    return errors
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == "update":
+        with tempfile.TemporaryDirectory() as update_path:
+            update_golden(update_path)
+        exit(0)
+
+    harness_errors = run_harness()
+    for error in harness_errors:
+        print(f"FAILED {error}")
+
+    if harness_errors:
+        exit(1)
+    print("Done!")